@@ -1,6 +1,7 @@
 import math
+from collections import deque
 from dataclasses import dataclass
-from typing import List, Tuple
+from typing import Deque, Tuple
 
 @dataclass
 class RegressionResult:
@@ -17,18 +18,14 @@ class FluxCalculator:
     
     def __init__(self, window_size: int = 30):
         self.window_size = window_size
-        self.times: List[float] = []
-        self.co2: List[float] = []
+        # Bounded deques drop the oldest point in O(1) as new ones arrive
+        self.times: Deque[float] = deque(maxlen=window_size)
+        self.co2: Deque[float] = deque(maxlen=window_size)
         
     def add_point(self, time_s: float, co2_ppm: float):
         """Add a data point and maintain window size."""
         self.times.append(time_s)
         self.co2.append(co2_ppm)
-        
-        # Keep window size fixed (sliding window)
-        if len(self.times) > self.window_size:
-            self.times.pop(0)
-            self.co2.pop(0)
             
     def clear(self):
         self.times.clear()
@@ -4,6 +4,14 @@ import logging
 from pathlib import Path
 from typing import Optional, List, Dict, Any
 
+INSERT_READING_SQL = '''
+    INSERT INTO readings (
+        session_id, timestamp, record_type, plot_id, record_num,
+        co2, h2o, temp_c, pressure, 
+        par, humidity, delta_co2, soil_resp_rate, probe_type, elapsed_time
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
 class DatabaseHandler:
     def __init__(self, db_path: str | None = None):
         if db_path is None:
@@ -127,18 +135,19 @@ class DatabaseHandler:
 
     def insert_reading(self, session_id: int, data: Dict[str, Any]):
         """Insert a raw reading record."""
+        self.insert_readings(session_id, [data])
+
+    def insert_readings(self, session_id: int, readings: List[Dict[str, Any]]):
+        """Insert a batch of raw reading records in a single transaction."""
         conn = sqlite3.connect(self.db_path, check_same_thread=False)
         cursor = conn.cursor()
         
         # Extract fields safely
         try:
-            cursor.execute('''
-                INSERT INTO readings (
-                    session_id, timestamp, record_type, plot_id, record_num,
-                    co2, h2o, temp_c, pressure, 
-                    par, humidity, delta_co2, soil_resp_rate, probe_type, elapsed_time
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
+            # In WAL mode NORMAL only syncs at checkpoints, not on every commit;
+            # a crash can't corrupt the database, only drop the last batches on power loss
+            cursor.execute('PRAGMA synchronous=NORMAL')
+            cursor.executemany(INSERT_READING_SQL, [(
                 session_id,
                 data.get('timestamp') or datetime.datetime.now().isoformat(),
                 data.get('type', ''),
@@ -154,7 +163,7 @@ class DatabaseHandler:
                 data.get('sr', 0),
                 data.get('probe_type', 0),
                 data.get('dt', 0)
-            ))
+            ) for data in readings])
             conn.commit()
         except Exception as e:
             logging.error(f"DB Insert Error: {e}")
@@ -1,7 +1,6 @@
 import asyncio
 import logging
 import serial
-import serial.tools.list_ports
 import errno
 from typing import Optional, Protocol, Callable, Any
 
@@ -433,4 +432,6 @@ async def get_serial_ports():
     return await loop.run_in_executor(None, _get_ports_sync)
 
 def _get_ports_sync():
-    return [p.device for p in serial.tools.list_ports.comports()]
+    # Imported here so loading the parser doesn't pull in the port backends
+    from serial.tools import list_ports
+    return [p.device for p in list_ports.comports()]
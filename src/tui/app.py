@@ -12,15 +12,18 @@ Features:
 
 import argparse
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from textual import on
 from textual.app import App, ComposeResult
 from textual.widgets import Footer, Header
 
 from src.tui.screens.connect import ConnectScreen
-from src.tui.screens.monitor import MonitorScreen
 from src.database import DatabaseHandler
 
+if TYPE_CHECKING:
+    from src.tui.screens.monitor import MonitorScreen
+
 
 class EGM4App(App):
     """Main EGM-4 Terminal User Interface Application."""
@@ -57,6 +60,10 @@ class EGM4App(App):
     @on(ConnectScreen.Connected)
     def handle_connection(self, event: ConnectScreen.Connected) -> None:
         """Handle successful connection from connect screen."""
+        # Deferred import: the monitor stack pulls in pyserial and the chart
+        # widgets, which aren't needed to paint the connect screen.
+        from src.tui.screens.monitor import MonitorScreen
+
         # Create monitor screen with the selected port and DB handler
         monitor = MonitorScreen(
             port=event.port, 
@@ -65,8 +72,7 @@ class EGM4App(App):
         )
         self.push_screen(monitor)
 
-    @on(MonitorScreen.Disconnected)
-    def handle_disconnection(self, event: MonitorScreen.Disconnected) -> None:
+    def on_monitor_screen_disconnected(self, event: "MonitorScreen.Disconnected") -> None:
         """Handle disconnection from monitor screen."""
         self.pop_screen()
         self.notify("Disconnected from device", severity="information")
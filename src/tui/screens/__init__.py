@@ -1,7 +1,17 @@
 """EGM4 TUI Screens Package."""
 
 from .connect import ConnectScreen
-from .monitor import MonitorScreen
-from .bigmode import BigModeScreen
 
 __all__ = ["ConnectScreen", "MonitorScreen", "BigModeScreen"]
+
+
+def __getattr__(name: str):
+    # MonitorScreen (and BigModeScreen with it) import lazily so that loading
+    # the connect screen doesn't pull in pyserial and the chart widgets.
+    if name == "MonitorScreen":
+        from .monitor import MonitorScreen
+        return MonitorScreen
+    if name == "BigModeScreen":
+        from .bigmode import BigModeScreen
+        return BigModeScreen
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
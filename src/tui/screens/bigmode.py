@@ -6,6 +6,21 @@ from textual.widgets import Footer, Static
 from textual.reactive import reactive
 
 
+# Simple large digit rendering using Unicode block characters
+_DIGIT_ROWS = {
+    '0': ("█▀▀█", "█  █", "█▄▄█"),
+    '1': ("  ▄█", "   █", "   █"),
+    '2': ("█▀▀█", " ▄▄█", "█▄▄▄"),
+    '3': ("█▀▀█", "  ▀█", "█▄▄█"),
+    '4': ("█  █", "█▄▄█", "   █"),
+    '5': ("█▀▀▀", "█▀▀█", "▄▄▄█"),
+    '6': ("█▀▀▀", "█▀▀█", "█▄▄█"),
+    '7': ("█▀▀█", "   █", "   █"),
+    '8': ("█▀▀█", "█▀▀█", "█▄▄█"),
+    '9': ("█▀▀█", "█▄▄█", "   █"),
+}
+
+
 class BigModeScreen(Screen):
     """Full-screen high-visibility CO2 display for field use."""
 
@@ -61,6 +76,13 @@ class BigModeScreen(Screen):
     record_count: reactive[int] = reactive(0, init=False)
     stability: reactive[str] = reactive("WAITING", init=False)
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._render_pending = False
+        self._co2_widget: Static | None = None
+        self._record_widget: Static | None = None
+        self._status_widget: Static | None = None
+
     def compose(self) -> ComposeResult:
         yield Static("---", id="big-co2-value")
         yield Static("ppm CO₂", id="big-co2-label")
@@ -69,33 +91,47 @@ class BigModeScreen(Screen):
         yield Footer()
 
     def on_mount(self) -> None:
-        """Initialize display with current values after mount."""
+        """Cache display widgets and initialize with current values."""
+        self._co2_widget = self.query_one("#big-co2-value", Static)
+        self._record_widget = self.query_one("#big-record-count", Static)
+        self._status_widget = self.query_one("#big-status", Static)
+        # Render directly: is_mounted only becomes True after on_mount returns
         self._update_co2_display()
         self._update_record_display()
         self._update_stability_display()
 
     def watch_current_co2(self, value: float | None) -> None:
         """Update the display when CO2 changes."""
-        if self.is_mounted:
-            self._update_co2_display()
+        self._schedule_render()
 
     def watch_record_count(self, value: int) -> None:
         """Update record count display."""
-        if self.is_mounted:
-            self._update_record_display()
+        self._schedule_render()
 
     def watch_stability(self, value: str) -> None:
         """Update stability indicator."""
-        if self.is_mounted:
-            self._update_stability_display()
+        self._schedule_render()
+
+    def _schedule_render(self) -> None:
+        """Coalesce reactive changes from the same tick into one render pass."""
+        if not self.is_mounted or self._render_pending:
+            return
+        self._render_pending = True
+        self.call_after_refresh(self._render_all)
+
+    def _render_all(self) -> None:
+        """Refresh every display widget from the current reactive values."""
+        self._render_pending = False
+        # Deferred from _schedule_render; the screen may have closed since
+        if not self.is_mounted:
+            return
+        self._update_co2_display()
+        self._update_record_display()
+        self._update_stability_display()
 
     def _update_co2_display(self) -> None:
         """Update the CO2 value widget."""
-        try:
-            co2_widget = self.query_one("#big-co2-value", Static)
-        except Exception:
-            return
-        
+        co2_widget = self._co2_widget
         value = self.current_co2
         
         if value is None:
@@ -116,23 +152,16 @@ class BigModeScreen(Screen):
             color = "#CC0000"  # Dark red
         
         # Use ASCII art style large numbers
-        co2_widget.update(self._render_big_number(int(value)))
+        co2_widget.update(self._render_big_number(abs(int(value))))
         co2_widget.styles.color = color
 
     def _update_record_display(self) -> None:
         """Update the record count widget."""
-        try:
-            self.query_one("#big-record-count", Static).update(f"Records: {self.record_count}")
-        except Exception:
-            pass
+        self._record_widget.update(f"Records: {self.record_count}")
 
     def _update_stability_display(self) -> None:
         """Update the stability indicator widget."""
-        try:
-            status_widget = self.query_one("#big-status", Static)
-        except Exception:
-            return
-        
+        status_widget = self._status_widget
         value = self.stability
         
         if value == "STABLE":
@@ -150,29 +179,21 @@ class BigModeScreen(Screen):
 
     def _render_big_number(self, value: int) -> str:
         """Render a large ASCII art number."""
-        # Simple large digit rendering using Unicode block characters
-        digits = {
-            '0': ["█▀▀█", "█  █", "█▄▄█"],
-            '1': ["  ▄█", "   █", "   █"],
-            '2': ["█▀▀█", " ▄▄█", "█▄▄▄"],
-            '3': ["█▀▀█", "  ▀█", "█▄▄█"],
-            '4': ["█  █", "█▄▄█", "   █"],
-            '5': ["█▀▀▀", "█▀▀█", "▄▄▄█"],
-            '6': ["█▀▀▀", "█▀▀█", "█▄▄█"],
-            '7': ["█▀▀█", "   █", "   █"],
-            '8': ["█▀▀█", "█▀▀█", "█▄▄█"],
-            '9': ["█▀▀█", "█▄▄█", "   █"],
-        }
-        
-        value_str = str(value)
-        lines = ["", "", ""]
+        # Build each row as a list of parts and join once, rather than
+        # growing strings with += per digit.
+        top, mid, bot = [], [], []
         
-        for char in value_str:
-            if char in digits:
-                for i, line in enumerate(digits[char]):
-                    lines[i] += line + " "
+        # Callers pass a non-negative int, so every char is a digit
+        for char in str(value):
+            glyph = _DIGIT_ROWS[char]
+            top.append(glyph[0])
+            top.append(" ")
+            mid.append(glyph[1])
+            mid.append(" ")
+            bot.append(glyph[2])
+            bot.append(" ")
         
-        return "\n".join(lines)
+        return "\n".join(("".join(top), "".join(mid), "".join(bot)))
 
     def action_exit_big_mode(self) -> None:
         """Exit big mode and return to normal monitor."""
@@ -1,17 +1,19 @@
 """Connect Screen - Serial port selection and connection."""
 
+import asyncio
+import math
+import time
 from dataclasses import dataclass
 from pathlib import Path
 import subprocess
 
-from textual import on
+from textual import on, work
 from textual.app import ComposeResult
 from textual.containers import Center, Vertical
 from textual.message import Message
 from textual.screen import Screen, ModalScreen
 from textual.widgets import Button, Footer, Header, OptionList, Static, Label
 from textual.widgets.option_list import Option
-from serial.tools import list_ports
 import importlib.metadata
 import sys
 
@@ -70,10 +72,35 @@ LOGO = r"""
 
 """
 
+def _format_session_start(start_time) -> str:
+    """Trim a stored session timestamp to 'YYYY-MM-DD HH:MM:SS' for display."""
+    if isinstance(start_time, str):
+        return start_time.split('.')[0].replace('T', ' ')
+    return start_time
+
+
 AUTO_CONNECT_DELAY = 5  # seconds
+PORT_CACHE_TTL = 2.0  # seconds
+
+_port_cache: tuple[float, list] | None = None
+
+
+def _cached_comports(ttl: float = PORT_CACHE_TTL) -> list:
+    """
+    Return the serial port list, reusing a scan younger than ttl seconds.
+    
+    Enumeration walks sysfs/udev (or the registry on Windows), so repeated
+    calls during the countdown share a single scan.
+    """
+    global _port_cache
+    now = time.monotonic()
+    if _port_cache is None or now - _port_cache[0] >= ttl:
+        from serial.tools import list_ports
+        _port_cache = (now, list_ports.comports())
+    return _port_cache[1]
 
 
-def find_best_port() -> str | None:
+def find_best_port(ports: list | None = None) -> str | None:
     """
     Auto-detect the most likely EGM-4 port.
     
@@ -83,8 +110,11 @@ def find_best_port() -> str | None:
     Priority:
     1. USB serial devices (cu.usbserial, ttyUSB, etc.)
     2. COM1-COM9 on Windows (commonly used for USB-serial adapters)
+    
+    Pass an already-enumerated ports list to avoid scanning again.
     """
-    ports = list_ports.comports()
+    if ports is None:
+        ports = _cached_comports()
     
     if not ports:
         return None
@@ -98,7 +128,9 @@ def find_best_port() -> str | None:
             return port.device
         if 'usb' in desc_lower and 'serial' in desc_lower:
             return port.device
-        if any(chip in desc_lower for chip in ['ftdi', 'prolific', 'ch340', 'cp210']):
+        # Common USB-serial adapter chips (plain `in` tests, no generator per port)
+        if ('ftdi' in desc_lower or 'prolific' in desc_lower
+                or 'ch340' in desc_lower or 'cp210' in desc_lower):
             return port.device
     
     # Priority 2: COM1-COM9 on Windows (USB-serial adapters)
@@ -210,15 +242,14 @@ class ConnectScreen(Screen):
 
         def on_mount(self) -> None:
             opt_list = self.query_one("#session-list", OptionList)
-            for sess_id, start_time, notes in self.sessions:
-                try:
-                    dt = start_time.split('.')[0].replace('T', ' ')
-                except (AttributeError, IndexError):
-                    dt = start_time
-                label = f"Session #{sess_id} - {dt}"
-                if notes:
-                    label += f"\n[dim]{notes}[/dim]"
-                opt_list.add_option(Option(label, id=str(sess_id)))
+            opt_list.add_options([
+                Option(
+                    f"Session #{sess_id} - {_format_session_start(start_time)}"
+                    + (f"\n[dim]{notes}[/dim]" if notes else ""),
+                    id=str(sess_id),
+                )
+                for sess_id, start_time, notes in self.sessions
+            ])
             opt_list.focus()
 
         @on(OptionList.OptionSelected)
@@ -233,9 +264,14 @@ class ConnectScreen(Screen):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._countdown = AUTO_CONNECT_DELAY
-        self._timer_handle = None
+        self._countdown_worker = None
         self._auto_connect_cancelled = False
         self._latest_session = None
+        self._best_port: str | None = None
+        self._last_countdown_text = ""
+        self._scanning = False
+        # Set when Enter is pressed before the scan has picked a port
+        self._connect_after_scan = False
 
     def compose(self) -> ComposeResult:
         yield Header()
@@ -275,15 +311,30 @@ class ConnectScreen(Screen):
             
         self.query_one("#platform-hint", Static).update(msg)
 
-        self.refresh_ports()
+        self._scan_ports(start_countdown=True)
+
+    @work(exclusive=True, group="port-scan")
+    async def _scan_ports(self, ttl: float = PORT_CACHE_TTL, start_countdown: bool = False) -> None:
+        """Refresh the port list in the background, optionally starting auto-connect."""
+        await self.refresh_ports(ttl)
+        
+        if self._connect_after_scan:
+            self._connect_after_scan = False
+            if self._best_port:
+                self._do_auto_connect()
+            else:
+                self.query_one("#status", Static).update("No USB serial device found")
+            return
+        
+        if not start_countdown or self._auto_connect_cancelled:
+            return
         
         # Only auto-connect if we found a USB serial device
-        best_port = find_best_port()
-        if best_port:
+        if self._best_port:
             self._start_countdown()
         else:
             # No USB serial device - clear countdown, user must select manually
-            self.query_one("#countdown", Static).update("")
+            self._set_countdown_text("")
 
 
     def action_handle_resume(self) -> None:
@@ -318,10 +369,11 @@ class ConnectScreen(Screen):
                 port_to_use = selected.id
         
         if not port_to_use:
-            port_to_use = find_best_port()
+            # Best guess from the last background scan; rescanning here would block the UI
+            port_to_use = self._best_port
             
         # Allow offline mode (port_to_use may be None)
-        self.query_one("#countdown", Static).update("")
+        self._set_countdown_text("")
         if port_to_use:
             self.query_one("#status", Static).update(f"Resuming Session #{session_id} on {port_to_use}...")
         else:
@@ -330,95 +382,119 @@ class ConnectScreen(Screen):
 
     def _start_countdown(self) -> None:
         """Start the auto-connect countdown."""
-        self._countdown = AUTO_CONNECT_DELAY
-        self._update_countdown_display()
-        self._timer_handle = self.set_interval(1.0, self._tick_countdown)
+        self._countdown_worker = self._run_countdown()
 
-    def _tick_countdown(self) -> None:
-        """Called every second during countdown."""
-        if self._auto_connect_cancelled:
-            return
-        
-        self._countdown -= 1
-        
-        if self._countdown <= 0:
-            self._stop_countdown()
-            self._do_auto_connect()
-        else:
+    @work(exclusive=True, group="countdown")
+    async def _run_countdown(self) -> None:
+        """Count down to a fixed monotonic deadline, then auto-connect.
+
+        Runs as a worker so it is cancelled with the screen and never leaves
+        a dangling interval behind.
+        """
+        deadline = time.monotonic() + AUTO_CONNECT_DELAY
+        while (remaining := deadline - time.monotonic()) > 0:
+            self._countdown = math.ceil(remaining)
             self._update_countdown_display()
+            # Sleep until the displayed number next changes
+            await asyncio.sleep(remaining - (self._countdown - 1))
+        
+        self._countdown = 0
+        self._countdown_worker = None
+        self._do_auto_connect()
 
     def _update_countdown_display(self) -> None:
         """Update the countdown display."""
-        best_port = find_best_port()
-        if best_port:
-            port_short = best_port.split("/")[-1]
-            self.query_one("#countdown", Static).update(
+        if self._best_port:
+            port_short = self._best_port.split("/")[-1]
+            self._set_countdown_text(
                 f"Auto-connecting to {port_short} in {self._countdown}s...\n"
                 f"[dim]Press any key to select manually[/dim]"
             )
 
+    def _set_countdown_text(self, text: str) -> None:
+        """Update the countdown label, skipping redraws when the text is unchanged."""
+        if text != self._last_countdown_text:
+            self._last_countdown_text = text
+            self.query_one("#countdown", Static).update(text)
+
     def _stop_countdown(self) -> None:
-        """Stop the countdown timer."""
-        if self._timer_handle:
-            self._timer_handle.stop()
-            self._timer_handle = None
+        """Stop the countdown worker."""
+        if self._countdown_worker:
+            self._countdown_worker.cancel()
+            self._countdown_worker = None
 
     def _cancel_auto_connect(self) -> None:
         """Cancel the auto-connect and allow manual selection."""
         if not self._auto_connect_cancelled:
             self._auto_connect_cancelled = True
             self._stop_countdown()
-            self.query_one("#countdown", Static).update("")
+            self._set_countdown_text("")
             self.query_one("#status", Static).update("[dim]Probe type auto-detected from data[/dim]")
 
     def _do_auto_connect(self) -> None:
         """Perform the auto-connect."""
-        best_port = find_best_port()
+        # Chosen by the background scan in refresh_ports
+        best_port = self._best_port
         if best_port:
-            self.query_one("#countdown", Static).update("")
+            self._set_countdown_text("")
             self.query_one("#status", Static).update(f"Connecting to {best_port}...")
             self.post_message(self.Connected(port=best_port))
 
     def on_key(self, event) -> None:
         """Cancel auto-connect on any keypress (except Enter which connects)."""
-        if event.key not in ("enter", "q"):
+        if event.key == "enter" and self._scanning:
+            # The port list has nothing selectable yet, so queue the connect
+            event.stop()
+            self.action_connect_now()
+        elif event.key not in ("enter", "q"):
             self._cancel_auto_connect()
 
-    def refresh_ports(self) -> None:
+    async def refresh_ports(self, ttl: float = PORT_CACHE_TTL) -> None:
         """Scan and display available serial ports."""
         option_list = self.query_one("#port-list", OptionList)
-        option_list.clear_options()
+        if option_list.option_count == 0:
+            # First scan only; a rescan keeps the current list until results arrive
+            option_list.add_option(Option("Scanning...", id="none", disabled=True))
         
-        ports = list_ports.comports()
+        # Enumeration blocks on sysfs/registry access, so keep it off the event loop
+        self._scanning = True
+        try:
+            ports = await asyncio.to_thread(_cached_comports, ttl)
+        finally:
+            self._scanning = False
+        self._best_port = find_best_port(ports)
         
         if not ports:
-            option_list.add_option(Option("No ports found", id="none", disabled=True))
+            option_list.clear_options().add_option(Option("No ports found", id="none", disabled=True))
             self.query_one("#status", Static).update("No serial ports detected")
             return
         
-        best_port = find_best_port()
+        best_port = self._best_port
         
+        # Build all options first so the list reflows once
+        options = []
+        best_index = None
         for port in ports:
             if port.device == best_port:
                 label = f"[*] {port.device} - {port.description}"
+                best_index = len(options)
             elif 'usb' in port.device.lower() or 'serial' in port.description.lower():
                 label = f"[+] {port.device} - {port.description}"
             else:
                 label = f"[ ] {port.device} - {port.description}"
-            option_list.add_option(Option(label, id=port.device))
+            options.append(Option(label, id=port.device))
+        # Swap the placeholder for the real list in one clear + bulk add
+        option_list.clear_options().add_options(options)
         
         # Highlight the best port
-        if best_port:
-            for i in range(option_list.option_count):
-                opt = option_list.get_option_at_index(i)
-                if opt.id == best_port:
-                    option_list.highlighted = i
-                    break
+        if best_index is not None:
+            option_list.highlighted = best_index
 
     def action_refresh_ports(self) -> None:
         """Action to refresh port list."""
         self._cancel_auto_connect()
-        self.refresh_ports()
+        # Explicit refresh always rescans
+        self._scan_ports(ttl=0)
 
     def action_connect_now(self) -> None:
         """Connect immediately."""
@@ -430,11 +506,18 @@ class ConnectScreen(Screen):
         if option_list.highlighted is not None:
             selected_option = option_list.get_option_at_index(option_list.highlighted)
             if selected_option.id != "none":
-                self.query_one("#countdown", Static).update("")
+                self._set_countdown_text("")
                 self.query_one("#status", Static).update(f"Connecting to {selected_option.id}...")
                 self.post_message(self.Connected(port=selected_option.id))
                 return
         
+        if self._scanning:
+            # No port to pick yet: connect once the scan finishes, without a countdown
+            self._cancel_auto_connect()
+            self._connect_after_scan = True
+            self.query_one("#status", Static).update("Scanning for ports...")
+            return
+        
         # Fall back to auto-detect
         self._do_auto_connect()
 
@@ -458,7 +541,8 @@ class ConnectScreen(Screen):
                 port_to_use = selected.id
         
         if not port_to_use:
-            port_to_use = find_best_port()
+            # Best guess from the last background scan; rescanning here would block the UI
+            port_to_use = self._best_port
             
         if not port_to_use:
             self.query_one("#status", Static).update("No port check for resume")
@@ -466,7 +550,7 @@ class ConnectScreen(Screen):
 
         if self._latest_session:
             sess_id, _ = self._latest_session
-            self.query_one("#countdown", Static).update("")
+            self._set_countdown_text("")
             self.query_one("#status", Static).update(f"Resuming Session #{sess_id} on {port_to_use}...")
             self.post_message(self.Connected(port=port_to_use, resume_session_id=sess_id))
 
@@ -475,6 +559,6 @@ class ConnectScreen(Screen):
         """Handle port selection - connect immediately."""
         self._stop_countdown()
         if event.option_id != "none":
-            self.query_one("#countdown", Static).update("")
+            self._set_countdown_text("")
             self.query_one("#status", Static).update(f"Connecting to {event.option_id}...")
             self.post_message(self.Connected(port=event.option_id))
@@ -1,15 +1,55 @@
 import csv
-import os
+import heapq
+import operator
+from collections import Counter, defaultdict
+from dataclasses import dataclass
 from datetime import datetime, date, timedelta
+from itertools import chain, islice, repeat
 from pathlib import Path
-from typing import List, Set
+from typing import Callable, Dict, Iterator, List, Sequence, Set, Tuple
 
-from textual import on
+from textual import on, work
 from textual.app import ComposeResult
 from textual.containers import Container, Vertical
+from textual.message import Message
 from textual.screen import ModalScreen
 from textual.widgets import Label, Static, SelectionList
-from textual.reactive import reactive
+
+
+EXPORT_HEADERS = (
+    'timestamp', 'type', 'plot', 'record',
+    'day', 'month', 'hour', 'minute',
+    'co2_ppm', 'h2o_mb', 'rht_c', 'temp_c', 'atmp_mb',
+    'rh_pct', 'par', 'probe_type',
+    'dc_ppm', 'dt_s', 'sr_rate',
+    'note', 'sample_id', 'sample_label', 'sample_ppm', 'sample_peak_ppm'
+)
+
+# Rows written between progress updates while exporting
+EXPORT_PROGRESS_ROWS = 5000
+
+
+def make_row_getter(fieldnames: Sequence[str]) -> Callable[[dict], tuple]:
+    """Return a function giving a row's values in fieldnames order, blank for missing keys."""
+    fieldnames = tuple(fieldnames)
+    get_fields = operator.itemgetter(*fieldnames)
+    if len(fieldnames) == 1:
+        # itemgetter with a single key returns the bare value, not a tuple
+        get_single = get_fields
+        get_fields = lambda row: (get_single(row),)
+
+    def row_values(row: dict) -> tuple:
+        # Live rows carry every field; rows restored from the DB lack a few, so
+        # fall back to a C-level map over row.get instead of raising.
+        try:
+            return get_fields(row)
+        except KeyError:
+            return tuple(map(row.get, fieldnames, repeat('')))
+
+    return row_values
+
+
+_export_values = make_row_getter(EXPORT_HEADERS)
 
 
 class ExportScreen(ModalScreen):
@@ -23,6 +63,11 @@ class ExportScreen(ModalScreen):
     - q/ESC: Cancel
     """
 
+    @dataclass
+    class Progress(Message):
+        """Message sent by the export worker as rows are written."""
+        written: int
+
     CSS = """
     ExportScreen {
         align: center middle;
@@ -83,27 +128,43 @@ class ExportScreen(ModalScreen):
     # State
     selected_plots: Set[int] = set()
     selected_dates: Set[date] = set()
-    mode = reactive("MENU")  # MENU, PLOT, DATE
+    # Plain attribute: every mode change is followed by an explicit refresh,
+    # so a reactive would only add a redundant repaint.
+    mode = "MENU"  # MENU, PLOT, DATE
 
     def __init__(self, recorded_data: List[dict]):
         super().__init__()
         self.recorded_data = recorded_data
 
-        # Analyze data
-        self.available_plots = sorted(list(set(r.get('plot', 0) for r in recorded_data)))
+        # Analyze data in a single pass, keeping each row's plot and parsed
+        # date so filtering never has to re-parse timestamps.
+        self._indexed: List[Tuple[dict, int, date | None]] = []
+        # Positions into _indexed, bucketed so a filter only visits matching rows
+        self._rows_by_plot: Dict[int, List[int]] = defaultdict(list)
+        self._rows_by_date: Dict[date, List[int]] = defaultdict(list)
+        self._dates_by_day: Dict[str, date] = {}
+        # Rows whose timestamp isn't a string pass any date filter, as before
+        self._undated_rows: List[int] = []
+        # Row counts per (plot, date) so the preview count never scans rows
+        self._counts_by_plot_date: Counter = Counter()
+        self._undated_counts_by_plot: Counter = Counter()
+        self._plot_set: Set[int] = set()
         self.available_dates = set()
-        for r in recorded_data:
-            try:
-                ts = r.get('timestamp')
-                if isinstance(ts, str):
-                    dt = datetime.fromisoformat(ts).date()
-                    self.available_dates.add(dt)
-            except (ValueError, TypeError, AttributeError):
-                pass
+        self._index_new_rows()
+        self.available_plots = sorted(self._plot_set)
+        self._sorted_dates = sorted(self.available_dates)
 
         # Defaults - select all
         self.selected_plots = set(self.available_plots)
         self.selected_dates = set()  # Empty = ALL
+        self._refresh_pending = False
+        self._exporting = False
+        self._filename_cache_key: Tuple[frozenset, frozenset] | None = None
+        self._filename_cache_value = ""
+        self._sorted_cache_key: Tuple[frozenset, frozenset] | None = None
+        self._sorted_cache_value: Tuple[List[int], List[date]] = ([], [])
+        # Last markup pushed to each status Static, keyed by widget id
+        self._last_rendered: Dict[str, str] = {}
 
     def compose(self) -> ComposeResult:
         with Container(id="export-container"):
@@ -137,41 +198,62 @@ class ExportScreen(ModalScreen):
 
 
     def on_mount(self) -> None:
+        # Cache widget references; refresh_display runs on every mode change
+        self._preview = self.query_one("#preview", Static)
+        self._filename_info = self.query_one("#filename-info", Static)
+        self._plot_status = self.query_one("#plot-status", Static)
+        self._date_status = self.query_one("#date-status", Static)
+        self._plot_container = self.query_one("#plot-container", Vertical)
+        self._date_container = self.query_one("#date-container", Vertical)
+        self._helper = self.query_one("#helper", Static)
+        self._plot_list = self.query_one("#plot-list", SelectionList)
+        self._date_list = self.query_one("#date-list", SelectionList)
+
         # Initialize Plot List
-        plot_list = self.query_one("#plot-list", SelectionList)
-        for p in self.available_plots:
-            plot_list.add_option((f"Plot {p}", p, True))
+        self._plot_list.add_options([(f"Plot {p}", p, True) for p in self.available_plots])
 
         # Initialize Date List
-        date_list = self.query_one("#date-list", SelectionList)
-        for d in sorted(self.available_dates):
-            date_list.add_option((d.isoformat(), d, False))
+        self._date_list.add_options([(d.isoformat(), d, False) for d in self._sorted_dates])
+
+        self.refresh_display()
+
+    def _schedule_refresh(self) -> None:
+        """Coalesce refresh requests from rapid key presses into one per frame."""
+        if self._refresh_pending:
+            return
+        self._refresh_pending = True
+        self.call_after_refresh(self._do_refresh)
 
+    def _do_refresh(self) -> None:
+        self._refresh_pending = False
+        if not self.is_mounted:
+            return
         self.refresh_display()
 
+    def _update_static(self, widget: Static, text: str) -> None:
+        """Update a Static only when its text changed, to avoid needless repaints."""
+        if self._last_rendered.get(widget.id) == text:
+            return
+        self._last_rendered[widget.id] = text
+        widget.update(text)
+
     def refresh_display(self) -> None:
         """Update all display elements."""
+        # Selections are only committed when leaving PLOT/DATE mode, so the
+        # summary can't change while a selection list is open. While exporting
+        # the preview line shows progress instead.
+        if self.mode == "MENU" and not self._exporting:
+            self._refresh_menu_only()
+        self._refresh_submode_ui()
+
+    def _refresh_menu_only(self) -> None:
+        """Update the preview, filename and plot/date status lines."""
         # Calculate filtered count
-        filtered_count = sum(1 for row in self.recorded_data if self._should_include(row))
+        filtered_count = self._count_filtered_rows()
         total = len(self.recorded_data)
 
         # Generate filename
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        plot_part = ""
-        if len(self.selected_plots) == 1:
-            plot_part = f"_plot{list(self.selected_plots)[0]}"
-        elif len(self.selected_plots) != len(self.available_plots):
-            plot_part = f"_{len(self.selected_plots)}plots"
-
-        date_part = ""
-        if self.selected_dates:
-            if len(self.selected_dates) == 1:
-                date_part = f"_{list(self.selected_dates)[0].isoformat()}"
-            else:
-                dates = sorted(self.selected_dates)
-                date_part = f"_{dates[0].isoformat()}to{dates[-1].isoformat()}"
-
-        filename = f"egm4{plot_part}{date_part}_{timestamp}.csv"
+        filename = self._export_filename()
 
         # Update preview
         if filtered_count == total:
@@ -180,10 +262,10 @@ class ExportScreen(ModalScreen):
             preview = "[yellow]⚠ No records match filters[/yellow]"
         else:
             preview = f"[bold cyan]{filtered_count}[/bold cyan] of {total} records"
-        self.query_one("#preview").update(preview)
+        self._update_static(self._preview, preview)
 
         # Update filename info
-        self.query_one("#filename-info").update(f"→ {filename}")
+        self._update_static(self._filename_info, f"→ {filename}")
 
         # Update plot status
         if len(self.selected_plots) == len(self.available_plots):
@@ -191,59 +273,176 @@ class ExportScreen(ModalScreen):
         elif not self.selected_plots:
             plot_str = "[red]NONE[/red]"
         else:
-            plot_str = ", ".join(str(p) for p in sorted(self.selected_plots))
-        self.query_one("#plot-status").update(f"  [b]p[/]  Plots: {plot_str}")
+            plot_str = ", ".join(str(p) for p in self._sorted_selection()[0])
+        self._update_static(self._plot_status, f"  [b]p[/]  Plots: {plot_str}")
 
         # Update date status
         if not self.selected_dates:
             date_str = "ALL"
         else:
-            dates = sorted(self.selected_dates)
+            dates = self._sorted_selection()[1]
             if len(dates) == 1:
                 date_str = dates[0].isoformat()
             elif len(dates) <= 3:
                 date_str = ", ".join(d.isoformat() for d in dates)
             else:
                 date_str = f"{dates[0].isoformat()}..{dates[-1].isoformat()} ({len(dates)} days)"
-        self.query_one("#date-status").update(f"  [b]d[/]  Dates: {date_str}")
+        self._update_static(self._date_status, f"  [b]d[/]  Dates: {date_str}")
 
-        # Update visibility and helper text
-        plot_cont = self.query_one("#plot-container")
-        date_cont = self.query_one("#date-container")
-        helper = self.query_one("#helper")
+    def _refresh_submode_ui(self) -> None:
+        """Update selection list visibility and helper text for the mode."""
+        plot_cont = self._plot_container
+        date_cont = self._date_container
+        helper = self._helper
 
         if self.mode == "MENU":
             plot_cont.display = False
             date_cont.display = False
-            helper.update("[dim]Press [b]p[/b] for plots, [b]d[/b] for dates, [b]e[/b] to export[/dim]")
+            self._update_static(helper, "[dim]Press [b]p[/b] for plots, [b]d[/b] for dates, [b]e[/b] to export[/dim]")
         elif self.mode == "PLOT":
             plot_cont.display = True
             date_cont.display = False
-            self.query_one("#plot-list").focus()
-            helper.update("[dim][b]SPACE[/b]: Toggle  [b]a[/b]: All  [b]n[/b]: None  [b]p[/b]/[b]ESC[/b]: Done[/dim]")
+            self._plot_list.focus()
+            self._update_static(helper, "[dim][b]SPACE[/b]: Toggle  [b]a[/b]: All  [b]n[/b]: None  [b]p[/b]/[b]ESC[/b]: Done[/dim]")
         elif self.mode == "DATE":
             plot_cont.display = False
             date_cont.display = True
-            self.query_one("#date-list").focus()
-            helper.update("[dim][b]SPACE[/b]: Toggle  [b]a[/b]: All  [b]n[/b]: None  [b]c[/b]: Clear  [b]d[/b]/[b]ESC[/b]: Done[/dim]")
+            self._date_list.focus()
+            self._update_static(helper, "[dim][b]SPACE[/b]: Toggle  [b]a[/b]: All  [b]n[/b]: None  [b]c[/b]: Clear  [b]d[/b]/[b]ESC[/b]: Done[/dim]")
+
+    def _sorted_selection(self) -> Tuple[List[int], List[date]]:
+        """Selected plots and dates in sorted order, re-sorted only on change."""
+        key = (frozenset(self.selected_plots), frozenset(self.selected_dates))
+        if key != self._sorted_cache_key:
+            self._sorted_cache_key = key
+            self._sorted_cache_value = (sorted(key[0]), sorted(key[1]))
+        return self._sorted_cache_value
+
+    def _filename_filter_part(self) -> str:
+        """Plot/date portion of the export filename, cached per selection."""
+        key = (frozenset(self.selected_plots), frozenset(self.selected_dates))
+        if key == self._filename_cache_key:
+            return self._filename_cache_value
+
+        plot_part = ""
+        if len(self.selected_plots) == 1:
+            plot_part = f"_plot{next(iter(self.selected_plots))}"
+        elif len(self.selected_plots) != len(self.available_plots):
+            plot_part = f"_{len(self.selected_plots)}plots"
 
-    def _should_include(self, row: dict) -> bool:
-        """Check if row matches current filters."""
-        if row.get('plot') not in self.selected_plots:
-            return False
+        date_part = ""
         if self.selected_dates:
-            try:
-                ts = row.get('timestamp')
-                if isinstance(ts, str):
-                    row_date = datetime.fromisoformat(ts).date()
-                    if row_date not in self.selected_dates:
-                        return False
-            except (ValueError, TypeError, AttributeError):
-                return False
-        return True
+            if len(self.selected_dates) == 1:
+                date_part = f"_{next(iter(self.selected_dates)).isoformat()}"
+            else:
+                dates = self._sorted_selection()[1]
+                date_part = f"_{dates[0].isoformat()}to{dates[-1].isoformat()}"
+
+        self._filename_cache_key = key
+        self._filename_cache_value = f"{plot_part}{date_part}"
+        return self._filename_cache_value
+
+    def _export_filename(self) -> str:
+        """Build the export filename for the current filters."""
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        return f"egm4{self._filename_filter_part()}_{timestamp}.csv"
+
+    def _index_new_rows(self) -> None:
+        """Index rows appended to recorded_data since the last call."""
+        indexed = self._indexed
+        dates_by_day = self._dates_by_day
+        for row in self.recorded_data[len(indexed):]:
+            plot = row.get('plot', 0)
+            row_date = None
+            ts = row.get('timestamp')
+            if isinstance(ts, str):
+                # Only the date prefix matters, and a session spans a handful
+                # of days, so each distinct day is parsed once.
+                day = ts[:10]
+                row_date = dates_by_day.get(day)
+                if row_date is None:
+                    try:
+                        row_date = date.fromisoformat(day)
+                    except ValueError:
+                        pass
+                    else:
+                        dates_by_day[day] = row_date
+                        self.available_dates.add(row_date)
+            pos = len(indexed)
+            self._plot_set.add(plot)
+            self._counts_by_plot_date[plot, row_date] += 1
+            if not isinstance(ts, str):
+                self._undated_rows.append(pos)
+                self._undated_counts_by_plot[plot] += 1
+            self._rows_by_plot[plot].append(pos)
+            if row_date is not None:
+                self._rows_by_date[row_date].append(pos)
+            indexed.append((row, plot, row_date))
+
+    def _all_rows_selected(self) -> bool:
+        """True when the filters are the defaults: every plot, all dates."""
+        return not self.selected_dates and self.selected_plots >= self._plot_set
+
+    def _iter_filtered_rows(self) -> Iterator[dict]:
+        """Iterate the rows matching the current filters, in recorded order."""
+        # Rows can keep arriving while the dialog is open
+        self._index_new_rows()
+        # Iterators are bounded to the current lengths so rows appended while
+        # the export worker is writing don't leak into the file.
+        if self._all_rows_selected():
+            return islice(self.recorded_data, len(self.recorded_data))
+        # Bind filter state to locals for the per-row loops below
+        selected_plots = self.selected_plots
+        indexed = self._indexed
+        if self.selected_dates:
+            # Only visit rows on the selected dates, then apply any plot filter.
+            # Buckets hold ascending positions, so merging keeps recorded order.
+            rows_by_date = self._rows_by_date
+            buckets = [
+                islice(rows_by_date[d], len(rows_by_date[d]))
+                for d in self.selected_dates if d in rows_by_date
+            ]
+            buckets.append(islice(self._undated_rows, len(self._undated_rows)))
+            if selected_plots >= self._plot_set:
+                # Usual case: every plot selected, so skip the per-row plot test
+                return (indexed[pos][0] for pos in heapq.merge(*buckets))
+            return (
+                indexed[pos][0] for pos in heapq.merge(*buckets)
+                if indexed[pos][1] in selected_plots
+            )
+        rows_by_plot = self._rows_by_plot
+        buckets = [
+            islice(rows_by_plot[p], len(rows_by_plot[p]))
+            for p in selected_plots if p in rows_by_plot
+        ]
+        return (indexed[pos][0] for pos in heapq.merge(*buckets))
+
+    def _count_filtered_rows(self) -> int:
+        """Count the rows matching the current filters from the histogram."""
+        self._index_new_rows()
+        if self._all_rows_selected():
+            return len(self.recorded_data)
+        selected_plots = self.selected_plots
+        selected_dates = self.selected_dates
+        # O(plots x dates), independent of the number of rows
+        total = sum(
+            count for (plot, row_date), count in self._counts_by_plot_date.items()
+            if plot in selected_plots and (not selected_dates or row_date in selected_dates)
+        )
+        if selected_dates:
+            # Rows without a timestamp string are kept by the date filter
+            total += sum(
+                count for plot, count in self._undated_counts_by_plot.items()
+                if plot in selected_plots
+            )
+        return total
 
     def on_key(self, event) -> None:
         """Handle keyboard shortcuts."""
+        if self._exporting:
+            # Ignore input until the export worker finishes
+            event.stop()
+            return
         if self.mode == "MENU":
             if event.key in ("q", "escape"):
                 event.stop()  # Prevent propagation to parent (which would quit app)
@@ -252,10 +451,10 @@ class ExportScreen(ModalScreen):
                 self.export_data()
             elif event.key == "p":
                 self.mode = "PLOT"
-                self.refresh_display()
+                self._schedule_refresh()
             elif event.key == "d":
                 self.mode = "DATE"
-                self.refresh_display()
+                self._schedule_refresh()
 
         elif self.mode == "PLOT":
             if event.key == "q":
@@ -263,21 +462,21 @@ class ExportScreen(ModalScreen):
                 self.dismiss()
             elif event.key in ("p", "escape", "enter"):
                 # Save and exit back to menu
-                self.selected_plots = set(self.query_one("#plot-list", SelectionList).selected)
+                self.selected_plots = set(self._plot_list.selected)
                 self.mode = "MENU"
-                self.refresh_display()
+                self._schedule_refresh()
 
             elif event.key == "e":
                 # Save selection then export
-                self.selected_plots = set(self.query_one("#plot-list", SelectionList).selected)
+                self.selected_plots = set(self._plot_list.selected)
                 self.mode = "MENU"
-                self.refresh_display()
+                self._schedule_refresh()
                 self.export_data()
 
             elif event.key == "a":
-                self.query_one("#plot-list", SelectionList).select_all()
+                self._plot_list.select_all()
             elif event.key == "n":
-                self.query_one("#plot-list", SelectionList).deselect_all()
+                self._plot_list.deselect_all()
 
         elif self.mode == "DATE":
             if event.key == "q":
@@ -285,29 +484,29 @@ class ExportScreen(ModalScreen):
                 self.dismiss()
             elif event.key in ("d", "escape", "enter"):
                 # Save and exit back to menu
-                selected = self.query_one("#date-list", SelectionList).selected
+                selected = self._date_list.selected
                 self.selected_dates = set(selected) if selected else set()
                 self.mode = "MENU"
-                self.refresh_display()
+                self._schedule_refresh()
                 
             elif event.key == "e":
                  # Save selection then export
-                selected = self.query_one("#date-list", SelectionList).selected
+                selected = self._date_list.selected
                 self.selected_dates = set(selected) if selected else set()
                 self.mode = "MENU"
-                self.refresh_display()
+                self._schedule_refresh()
                 self.export_data()
 
             elif event.key == "a":
-                self.query_one("#date-list", SelectionList).select_all()
+                self._date_list.select_all()
             elif event.key == "n":
-                self.query_one("#date-list", SelectionList).deselect_all()
+                self._date_list.deselect_all()
             elif event.key == "c":
                 # Clear all = show ALL dates
-                self.query_one("#date-list", SelectionList).deselect_all()
+                self._date_list.deselect_all()
                 self.selected_dates = set()
                 self.mode = "MENU"
-                self.refresh_display()
+                self._schedule_refresh()
 
     def export_data(self) -> None:
         """Export filtered data to CSV."""
@@ -316,29 +515,19 @@ class ExportScreen(ModalScreen):
         logging.info(f"Export initiated: {len(self.recorded_data)} total records")
         
         # Filter data
-        filtered_data = [row for row in self.recorded_data if self._should_include(row)]
+        # Stream matching rows straight into the writer; peek one to detect
+        # an empty selection before creating the file.
+        filtered_rows = self._iter_filtered_rows()
+        first_row = next(filtered_rows, None)
 
-        if not filtered_data:
+        if first_row is None:
             self.app.notify("No records match filters!", severity="warning")
             return
 
-        # Generate filename
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        plot_part = ""
-        if len(self.selected_plots) == 1:
-            plot_part = f"_plot{list(self.selected_plots)[0]}"
-        elif len(self.selected_plots) != len(self.available_plots):
-            plot_part = f"_{len(self.selected_plots)}plots"
-
-        date_part = ""
-        if self.selected_dates:
-            if len(self.selected_dates) == 1:
-                date_part = f"_{list(self.selected_dates)[0].isoformat()}"
-            else:
-                dates = sorted(self.selected_dates)
-                date_part = f"_{dates[0].isoformat()}to{dates[-1].isoformat()}"
+        filtered_count = self._count_filtered_rows()
 
-        filename = f"egm4{plot_part}{date_part}_{timestamp}.csv"
+        # Generate filename
+        filename = self._export_filename()
         
         # Determine export directory: Downloads folder or current directory
         # Force absolute path resolution
@@ -353,33 +542,51 @@ class ExportScreen(ModalScreen):
             # Fallback if any path resolution fails
             export_path = Path.cwd() / filename
 
-        try:
-            headers = [
-                'timestamp', 'type', 'plot', 'record',
-                'day', 'month', 'hour', 'minute',
-                'co2_ppm', 'h2o_mb', 'rht_c', 'temp_c', 'atmp_mb',
-                'rh_pct', 'par', 'probe_type',
-                'dc_ppm', 'dt_s', 'sr_rate',
-                'note', 'sample_id', 'sample_label', 'sample_ppm', 'sample_peak_ppm'
-            ]
+        # Write on a worker thread so large exports don't freeze the UI
+        self._exporting = True
+        self._update_static(self._preview, f"[bold cyan]Exporting {filtered_count} records...[/bold cyan]")
+        self._export_worker(export_path, chain((first_row,), filtered_rows))
 
-            with open(export_path, 'w', newline='') as f:
-                writer = csv.DictWriter(f, fieldnames=headers, extrasaction='ignore')
-                writer.writeheader()
-                writer.writerows(filtered_data)
+    @work(exclusive=True, thread=True, group="export")
+    def _export_worker(self, export_path: Path, rows: Iterator[dict]) -> None:
+        """Write the export CSV, posting progress every EXPORT_PROGRESS_ROWS rows."""
+        try:
+            written = 0
+            with open(export_path, 'w', newline='', buffering=1 << 20) as f:
+                writer = csv.writer(f)
+                writer.writerow(EXPORT_HEADERS)
+                values = map(_export_values, rows)
+                while chunk := list(islice(values, EXPORT_PROGRESS_ROWS)):
+                    writer.writerows(chunk)
+                    written += len(chunk)
+                    if len(chunk) == EXPORT_PROGRESS_ROWS:
+                        self.post_message(self.Progress(written))
 
             # Success
-            file_size = os.path.getsize(export_path)
-            size_str = f"{file_size / 1024:.1f} KB" if file_size >= 1024 else f"{file_size} bytes"
-            
-            # Show FULL RESOLVED PATH in notification
-            self.app.notify(
-                f"Saved to: {export_path}",
-                title="Export Success",
-                severity="information",
-                timeout=10
-            )
-            self.dismiss()
+            self.app.call_from_thread(self._export_finished, export_path)
 
         except Exception as e:
-            self.app.notify(f"Export failed: {str(e)}", severity="error", timeout=10)
+            self.app.call_from_thread(self._export_failed, e)
+
+    def on_export_screen_progress(self, event: "ExportScreen.Progress") -> None:
+        """Show the export worker's progress in the preview line."""
+        if self._exporting:
+            self._update_static(self._preview, f"[bold cyan]Exporting... {event.written} records written[/bold cyan]")
+
+    def _export_finished(self, export_path: Path) -> None:
+        """Notify where the file was saved and close the dialog."""
+        self._exporting = False
+        # Show FULL RESOLVED PATH in notification
+        self.app.notify(
+            f"Saved to: {export_path}",
+            title="Export Success",
+            severity="information",
+            timeout=10
+        )
+        self.dismiss()
+
+    def _export_failed(self, error: Exception) -> None:
+        """Report a failed export and re-enable the dialog."""
+        self._exporting = False
+        self.app.notify(f"Export failed: {str(error)}", severity="error", timeout=10)
+        self.refresh_display()
@@ -1,7 +1,10 @@
 """Monitor Screen - Live data monitoring dashboard."""
 
+import asyncio
 import csv
 import datetime
+import os
+from collections import deque
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -13,7 +16,7 @@ from textual.screen import Screen
 from textual.widgets import Footer, Header, Static
 
 from src.tui.widgets.co2_chart import CO2PlotWidget
-from src.tui.widgets.stats import StatsWidget
+from src.tui.widgets.stats import STABILITY_WINDOW, StatsWidget
 from src.tui.widgets.log import LogWidget
 from src.tui.widgets.legend import ChannelLegend
 from src.egm_interface import EGM4Serial
@@ -26,6 +29,41 @@ import time
 from src.tui.screens.note import NoteInputScreen
 
 
+# Raw serial log buffering: lines are flushed at most once per interval
+RAW_LOG_BUFFER_SIZE = 65536
+RAW_LOG_FLUSH_INTERVAL = 1.0
+
+# Seconds between batched DB inserts of buffered readings
+DB_FLUSH_INTERVAL = 0.25
+
+
+# Custom message types
+@dataclass
+class SerialError(Message):
+    """Message for serial errors."""
+    message: str
+
+
+def _write_csv(filename: str, rows: list[dict]) -> None:
+    """Write rows to a CSV file, taking the columns from the first row."""
+    from src.tui.screens.export import make_row_getter
+
+    with open(filename, 'w', newline='', buffering=1 << 20) as f:
+        fieldnames = tuple(rows[0])
+        writer = csv.writer(f)
+        writer.writerow(fieldnames)
+        writer.writerows(map(make_row_getter(fieldnames), rows))
+
+
+def _port_present(port: str) -> bool:
+    """Return True if the serial port still exists."""
+    if port.startswith('/'):
+        # POSIX device node: a stat is enough, no need to enumerate every port
+        return os.path.exists(port)
+    from serial.tools import list_ports
+    return any(p.device == port for p in list_ports.comports())
+
+
 class MonitorScreen(Screen):
     """Main monitoring dashboard screen."""
 
@@ -33,6 +71,11 @@ class MonitorScreen(Screen):
     SAMPLE_STEP_INJECT = "inject"
     SAMPLE_STEP_SETTLE = "settle"
     SAMPLE_STEP_FLUSH = "flush"
+    SAMPLE_STEP_MESSAGES = {
+        SAMPLE_STEP_INJECT: "STEP 1: INJECT SAMPLE (N)",
+        SAMPLE_STEP_SETTLE: "STEP 2: WAIT TO SETTLE, CAPTURE (N)",
+        SAMPLE_STEP_FLUSH: "STEP 3: INJECT AMBIENT AIR (N)",
+    }
 
     # Defer to styles.tcss or use simple layout
     DEFAULT_CSS = """
@@ -105,12 +148,22 @@ class MonitorScreen(Screen):
         self._is_resuming = resume_session_id is not None
         self.flux_calc = FluxCalculator(window_size=30)  # 30s window for Flux
         self._plot_base_times = {} # Track base time for each plot to synthesize timestamps from DT
+        self._last_dt_per_plot: dict[int, float] = {}  # Last DT per plot, to detect a new cycle
+        self._fallback_plot_starts: dict[int, datetime.datetime] = {}  # First timestamp per plot for old rows without DT
+        self._big_screen: BigModeScreen | None = None
         self.static_sampling_mode = False
         self._sample_counter = 0
         self._last_measurement: dict | None = None
         self._sample_capture_active = False
         self._sample_peak_ppm: float | None = None
         self._sample_flow_step = self.SAMPLE_STEP_IDLE
+        # Samples waiting for the next frame; see _queue_data
+        self._pending_data: deque[tuple[str, dict]] = deque()
+        self._data_flush_pending = False
+        # Readings waiting to be written to the DB; see _flush_db_buffer
+        self._db_buffer: list[dict] = []
+        # The batch currently being written, if any
+        self._db_write: asyncio.Future | None = None
 
     def compose(self) -> ComposeResult:
         yield Header()
@@ -127,8 +180,13 @@ class MonitorScreen(Screen):
 
     def on_mount(self) -> None:
         """Start serial connection when screen mounts."""
-        log = self.query_one("#log", LogWidget)
-        stats = self.query_one("#stats", StatsWidget)
+        # Cache widget references; the data handlers use them on every sample
+        self._chart_widget = self.query_one("#chart", CO2PlotWidget)
+        self._stats_widget = self.query_one("#stats", StatsWidget)
+        self._log_widget = self.query_one("#log", LogWidget)
+        self._legend_widget = self.query_one("#legend", ChannelLegend)
+        log = self._log_widget
+        stats = self._stats_widget
         
         # Offline mode: skip serial connection
         if not self.port:
@@ -148,14 +206,6 @@ class MonitorScreen(Screen):
             # Start periodic USB port monitoring
             self._usb_monitor = self.set_interval(2.0, self._check_usb_port)
             
-            # Open raw log file
-            log_filename = f"raw_dump_{datetime.datetime.now().strftime('%Y-%m-%d')}.log"
-            try:
-                self.raw_log_file = open(log_filename, 'a')
-                self.raw_log_file.write(f"\n--- Session started {datetime.datetime.now().isoformat()} ---\n")
-            except Exception:
-                pass
-            
         # Create DB Session
         if self.db:
             try:
@@ -163,17 +213,19 @@ class MonitorScreen(Screen):
                     self._restore_session(self.session_id)
                 else:
                     self.session_id = self.db.create_session(notes=f"Monitor session started on {self.port}")
-                    self.query_one("#log", LogWidget).log_success(f"New session #{self.session_id} started")
+                    self._log_widget.log_success(f"New session #{self.session_id} started")
             except Exception as e:
-                self.query_one("#log", LogWidget).log_error(f"DB Error: {e}")
+                self._log_widget.log_error(f"DB Error: {e}")
+            # Readings are inserted in batches rather than one transaction each
+            self.set_interval(DB_FLUSH_INTERVAL, self._flush_db_buffer)
 
     def _restore_session(self, session_id: int) -> None:
         """Restore data from a previous session."""
         try:
-            log = self.query_one("#log", LogWidget)
-            chart = self.query_one("#chart", CO2PlotWidget)
-            stats = self.query_one("#stats", StatsWidget)
-            legend = self.query_one("#legend", ChannelLegend)
+            log = self._log_widget
+            chart = self._chart_widget
+            stats = self._stats_widget
+            legend = self._legend_widget
 
             # Clear existing data to prevent overlap/duplicates
             chart.clear_data()
@@ -193,34 +245,19 @@ class MonitorScreen(Screen):
             readings.sort(key=lambda r: (r['plot_id'], r['elapsed_time'] or 0))
 
             count = 0
+            co2_values = []
+            last_record = None
+            add_row = self.recorded_data.append
+            add_data = chart.add_data
 
             # Use batch mode to avoid replotting on every data point
             for row in readings:
                 # Use stored elapsed_time directly if available (new behavior)
                 # This is the actual DT from the EGM device
-                stored_dt = row.get('elapsed_time')
-
-                if stored_dt is not None:
-                    dt_val = stored_dt
-                else:
+                dt_val = row.get('elapsed_time')
+                if dt_val is None:
                     # Fallback for old data without elapsed_time column
-                    # Parse timestamp and calculate
-                    try:
-                        ts_str = row['timestamp']
-                        if isinstance(ts_str, str):
-                            ts = datetime.datetime.fromisoformat(ts_str)
-                        else:
-                            ts = ts_str
-                    except (ValueError, TypeError, AttributeError):
-                        ts = datetime.datetime.now()
-
-                    # Need to track first timestamp per plot for calculation
-                    pid = row['plot_id']
-                    if not hasattr(self, '_fallback_plot_starts'):
-                        self._fallback_plot_starts = {}
-                    if pid not in self._fallback_plot_starts:
-                        self._fallback_plot_starts[pid] = ts
-                    dt_val = (ts - self._fallback_plot_starts[pid]).total_seconds()
+                    dt_val = self._legacy_elapsed(row)
 
                 # Reconstruct parsed dict format expected by widgets
                 parsed = {
@@ -254,44 +291,76 @@ class MonitorScreen(Screen):
                 }
 
                 # Add to local cache for export
-                self.recorded_data.append(parsed)
+                add_row(parsed)
 
                 # Update widgets in batch mode (no replot per item)
-                chart.add_data(parsed, batch_mode=True)
-                stats.add_reading(row['co2'], record=row['record_num'])
+                add_data(parsed, batch_mode=True)
+                co2_values.append(row['co2'])
+                if row['record_num'] is not None:
+                    last_record = row['record_num']
                 count += 1
 
-            # Replot once after all data is loaded
+            # Replot and update stats once after all data is loaded
             chart.replot()
+            stats.add_readings(co2_values, record=last_record)
 
             # Update legend with restored plots
             legend.set_plot_info(chart.filter_plot, chart.get_known_plots())
             log.log_success(f"Restored {count} readings")
 
         except Exception as e:
-            self.query_one("#log", LogWidget).log_error(f"Restore Failed: {e}")
+            self._log_widget.log_error(f"Restore Failed: {e}")
+
+    def _legacy_elapsed(self, row: dict) -> float:
+        """Derive DT for an old reading from its timestamp and its plot's first one."""
+        try:
+            ts_str = row['timestamp']
+            if isinstance(ts_str, str):
+                ts = datetime.datetime.fromisoformat(ts_str)
+            else:
+                ts = ts_str
+        except (ValueError, TypeError, AttributeError):
+            ts = datetime.datetime.now()
+
+        # Need to track first timestamp per plot for calculation
+        start = self._fallback_plot_starts.setdefault(row['plot_id'], ts)
+        return (ts - start).total_seconds()
 
     def _write_raw_line(self, row_type: str, text: str) -> None:
         if self.raw_log_file:
             try:
-                timestamp = datetime.datetime.now().strftime("%H:%M:%S")
+                timestamp = time.strftime("%H:%M:%S")
                 self.raw_log_file.write(f"{row_type} [{timestamp}] {text}\n")
-                self.raw_log_file.flush()
             except (IOError, OSError):
                 pass
 
+    async def _open_raw_log(self) -> None:
+        """Open today's raw dump file and start its periodic flush."""
+        log_filename = f"raw_dump_{datetime.datetime.now().strftime('%Y-%m-%d')}.log"
+        try:
+            self.raw_log_file = await asyncio.to_thread(
+                open, log_filename, 'a', buffering=RAW_LOG_BUFFER_SIZE
+            )
+            self.raw_log_file.write(f"\n--- Session started {datetime.datetime.now().isoformat()} ---\n")
+            # Flush on a timer rather than per line to keep syscalls off the data path
+            self.set_interval(RAW_LOG_FLUSH_INTERVAL, self._flush_raw_log)
+        except Exception:
+            pass
+
+    def _flush_raw_log(self) -> None:
+        if self.raw_log_file:
+            try:
+                self.raw_log_file.flush()
+            except (ValueError, OSError):
+                # Already closed on quit/unmount
+                pass
+
     def _sample_step_message(self, step: str) -> str:
-        if step == self.SAMPLE_STEP_INJECT:
-            return "STEP 1: INJECT SAMPLE (N)"
-        if step == self.SAMPLE_STEP_SETTLE:
-            return "STEP 2: WAIT TO SETTLE, CAPTURE (N)"
-        if step == self.SAMPLE_STEP_FLUSH:
-            return "STEP 3: INJECT AMBIENT AIR (N)"
-        return ""
+        return self.SAMPLE_STEP_MESSAGES.get(step, "")
 
     def _set_sample_step(self, step: str) -> None:
         self._sample_flow_step = step
-        stats = self.query_one("#stats", StatsWidget)
+        stats = self._stats_widget
         stats.static_sampling_step = self._sample_step_message(step) if self.static_sampling_mode else ""
 
     def _reset_sample_cycle(self) -> None:
@@ -299,20 +368,20 @@ class MonitorScreen(Screen):
         self._sample_peak_ppm = None
         self._set_sample_step(self.SAMPLE_STEP_INJECT)
 
-    def _check_usb_port(self) -> None:
+    @work(exclusive=True, group="usb-check")
+    async def _check_usb_port(self) -> None:
         """Check if the USB port is still present."""
-        from serial.tools import list_ports
-        
-        available_ports = [p.device for p in list_ports.comports()]
-        stats = self.query_one("#stats", StatsWidget)
+        # Off the event loop: port enumeration can be slow on some systems
+        present = await asyncio.to_thread(_port_present, self.port)
+        stats = self._stats_widget
         
-        if self.port not in available_ports:
+        if not present:
             # Port disappeared - USB unplugged
             if stats.is_connected:
                 stats.is_connected = False
                 # Only log disconnect once
                 if not self._disconnect_logged:
-                    log = self.query_one("#log", LogWidget)
+                    log = self._log_widget
                     log.log_error(f"USB disconnected: {self.port}")
                     self._disconnect_logged = True
         else:
@@ -320,7 +389,7 @@ class MonitorScreen(Screen):
             if not stats.is_connected:
                 stats.is_connected = True
                 stats.reconnect_count += 1
-                log = self.query_one("#log", LogWidget)
+                log = self._log_widget
                 log.log_success(f"USB reconnected: {self.port}")
                 # Reset disconnect flag for next time
                 self._disconnect_logged = False
@@ -335,6 +404,7 @@ class MonitorScreen(Screen):
         """Clean up when screen unmounts."""
         if self.serial:
             await self.serial.disconnect()
+        await self._drain_db_buffer()
         if self.raw_log_file:
             try:
                 self.raw_log_file.write(f"--- Session ended {datetime.datetime.now().isoformat()} ---\n")
@@ -357,17 +427,23 @@ class MonitorScreen(Screen):
             if self.raw_log_file:
                 try:
                     self.raw_log_file.write(raw_line + '\n')
-                    self.raw_log_file.flush()
                 except Exception:
                     pass
-            
-            self.post_message(DataReceived(raw_line=raw_line, parsed=parsed_data))
+
+            # Paused samples are only kept in the raw log
+            if not self.is_paused:
+                self._queue_data(raw_line, parsed_data)
 
         def on_error(msg: str) -> None:
             self.post_message(SerialError(message=msg))
 
         self.serial.data_callback = on_data
         self.serial.error_callback = on_error
+
+        # Open the raw log here rather than in on_mount, off the event loop;
+        # a restarted stream keeps the already open file
+        if self.raw_log_file is None:
+            await self._open_raw_log()
         
         # Connect asynchronously
         success = await self.serial.connect(self.port)
@@ -378,30 +454,69 @@ class MonitorScreen(Screen):
         # Start processing loop (this blocks the worker, which is fine for async worker)
         await self.serial.process_loop()
 
-    @on(Message)
-    def handle_data_received(self, event: Message) -> None:
-        """Handle incoming serial data."""
-        if not isinstance(event, DataReceived):
+    def _queue_data(self, raw_line: str, parsed: dict) -> None:
+        """Queue a sample; queued samples are processed together once per frame."""
+        self._pending_data.append((raw_line, parsed))
+        if self._data_flush_pending:
             return
-        
-        if self.is_paused:
+        self._data_flush_pending = True
+        self.call_after_refresh(self._flush_pending_data)
+
+    def _flush_pending_data(self) -> None:
+        """Process every queued sample, then redraw the chart and legend once."""
+        self._data_flush_pending = False
+        pending = self._pending_data
+        measurements = 0
+        while pending:
+            raw_line, parsed = pending.popleft()
+            if self._process_data(raw_line, parsed):
+                measurements += 1
+        if not measurements:
             return
-        
-        parsed = event.parsed
+
+        chart = self._chart_widget
+        stats = self._stats_widget
+        # Bump the counters once per batch rather than once per sample
+        stats.parsed_records += measurements
+        stats.record_count += measurements
+        res = self.flux_calc.calculate()
+        stats.flux_slope = res.slope
+        stats.flux_r2 = res.r_squared
+        chart.replot()
+
+        # Update legend with current plot info
+        self._legend_widget.set_plot_info(chart.filter_plot, chart.get_known_plots())
+
+        # Update big mode screen if it's active
+        if self._big_screen is not None and self._big_screen.is_current:
+            self._big_screen.current_co2 = self._last_measurement['co2_ppm']
+            self._big_screen.record_count = stats.record_count
+            # Calculate stability from the running window in StatsWidget
+            if len(stats._history) >= STABILITY_WINDOW:
+                stdev = stats.recent_stdev()
+                if stdev < 5:
+                    self._big_screen.stability = "STABLE"
+                elif stdev < 20:
+                    self._big_screen.stability = "VARIABLE"
+                else:
+                    self._big_screen.stability = "NOISY"
+
+    def _process_data(self, raw_line: str, parsed: dict) -> bool:
+        """Record one sample. Returns True if it was an R/M measurement."""
+        if self.is_paused:
+            return False
+
         rec_type = parsed.get('type', 'unknown')
         
-        chart = self.query_one("#chart", CO2PlotWidget)
-        stats = self.query_one("#stats", StatsWidget)
-        log = self.query_one("#log", LogWidget)
-        
-        timestamp = datetime.datetime.now().isoformat()
+        chart = self._chart_widget
+        stats = self._stats_widget
+        log = self._log_widget
 
         # Track malformed/unknown records for quick quality checks.
         if parsed.get('error') or rec_type == 'unknown':
             stats.parse_errors += 1
         
         if rec_type in ('R', 'M'):
-            stats.parsed_records += 1
             # Try to synthesize timestamp from DT (if available) for better consistency
             # This is crucial for Memory Dumps where arrival time != measurement time
             dt_val = parsed.get('dt')
@@ -412,9 +527,6 @@ class MonitorScreen(Screen):
                 
                 # Check for new measurement cycle (DT reset)
                 reset_base = False
-                if not hasattr(self, '_last_dt_per_plot'):
-                    self._last_dt_per_plot = {}
-                
                 last = self._last_dt_per_plot.get(plot_id)
                 if last is not None and dt_val < last:
                     reset_base = True
@@ -428,6 +540,9 @@ class MonitorScreen(Screen):
                 # Calculate absolute timestamp from base + dt
                 new_ts = self._plot_base_times[plot_id] + datetime.timedelta(seconds=dt_val)
                 timestamp = new_ts.isoformat()
+            else:
+                # Only measurements without DT are stamped with the arrival time
+                timestamp = datetime.datetime.now().isoformat()
             
             # Inject timestamp for DB consistency (and for Resume restoration)
             parsed['timestamp'] = timestamp
@@ -471,18 +586,16 @@ class MonitorScreen(Screen):
             
             # DB Insert (Async Worker)
             if self.db and self.session_id:
-                self.save_reading_worker(self.session_id, parsed)
+                # Buffered; written in batches by _flush_db_buffer
+                self._db_buffer.append(parsed)
             
-            chart.add_data(parsed)
+            # Chart is replotted once per batch in _flush_pending_data
+            chart.add_data(parsed, batch_mode=True)
             stats.add_reading(co2, record=parsed.get('record'))
             
-            # Real-time Flux Calc
+            # Real-time Flux Calc (regression runs once per batch)
             self.flux_calc.add_point(time.time(), co2)
-            res = self.flux_calc.calculate()
-            stats.flux_slope = res.slope
-            stats.flux_r2 = res.r_squared
             
-            stats.record_count += 1
             stats.data_mode = rec_type  # Update mode indicator (M=Real-Time, R=Memory)
             stats.device_status = ""  # Clear warmup/zero status when data arrives
             
@@ -493,27 +606,9 @@ class MonitorScreen(Screen):
                 log.log_download_record(plot, record, co2)
             else:
                 log.log_data(plot, record, co2)
-            
-            # Update legend with current plot info
-            legend = self.query_one("#legend", ChannelLegend)
-            legend.set_plot_info(chart.filter_plot, chart.get_known_plots())
-            
-            # Update big mode screen if it's active
-            if hasattr(self, '_big_screen') and self._big_screen.is_current:
-                self._big_screen.current_co2 = co2
-                self._big_screen.record_count = stats.record_count
-                # Calculate stability
-                history = list(stats._history)
-                if len(history) >= 10:
-                    import statistics
-                    stdev = statistics.stdev(history[-10:])
-                    if stdev < 5:
-                        self._big_screen.stability = "STABLE"
-                    elif stdev < 20:
-                        self._big_screen.stability = "VARIABLE"
-                    else:
-                        self._big_screen.stability = "NOISY"
-            
+
+            return True
+
         elif rec_type == 'B':
             co2 = parsed.get('co2_ppm', 0)
             log.log_info(f"Device startup: EGM4, CO2: {co2:.1f}")
@@ -547,27 +642,31 @@ class MonitorScreen(Screen):
             self.app.bell()
             
         else:
-            log.log_event(event.raw_line[:60], "dim")
+            log.log_event(raw_line[:60], "dim")
+
+        return False
 
     @on(CO2PlotWidget.ProbeTypeChanged)
     def handle_probe_change(self, event: CO2PlotWidget.ProbeTypeChanged) -> None:
         """Handle probe type change detection."""
-        legend = self.query_one("#legend", ChannelLegend)
+        legend = self._legend_widget
         legend.set_probe_type(event.probe_type)
         # Debug log 
-        log = self.query_one("#log", LogWidget)
+        log = self._log_widget
         log.log_event(f"Probe type detected: {event.probe_type}", "warning")
 
-    @on(Message)
-    def handle_serial_error(self, event: Message) -> None:
+    @on(SerialError)
+    def handle_serial_error(self, event: SerialError) -> None:
         """Handle serial errors - log only, no notification."""
-        if not isinstance(event, SerialError):
-            return
+        # Handle samples that arrived before the error first, so the log
+        # stays in arrival order
+        if self._pending_data:
+            self._flush_pending_data()
         
         # Log the error but don't show annoying notification
-        log = self.query_one("#log", LogWidget)
+        log = self._log_widget
         log.log_error(event.message)
-        stats = self.query_one("#stats", StatsWidget)
+        stats = self._stats_widget
         stats.serial_errors += 1
         
         # If it's a device error, mark as disconnected
@@ -577,9 +676,9 @@ class MonitorScreen(Screen):
     async def action_quit_app(self) -> None:
         """Save work and quit the application."""
         # Immediate feedback that we're quitting
-        log = self.query_one("#log", LogWidget)
+        log = self._log_widget
         log.log_info("Saving and quitting...")
-        stats = self.query_one("#stats", StatsWidget)
+        stats = self._stats_widget
         stats.device_status = "QUITTING..."
         
         # Clear callbacks to prevent error messages during shutdown
@@ -598,16 +697,17 @@ class MonitorScreen(Screen):
             except Exception:
                 pass
         
+        # Record samples still waiting for the next frame
+        if self._pending_data:
+            self._flush_pending_data()
+        await self._drain_db_buffer()
+
         # Auto-export if there's data
         if self.recorded_data:
             filename = f"egm4_data_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
             try:
-                with open(filename, 'w', newline='') as f:
-                    # Get fieldnames from first record
-                    fieldnames = list(self.recorded_data[0].keys())
-                    writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction='ignore')
-                    writer.writeheader()
-                    writer.writerows(self.recorded_data)
+                # Write on a thread so the UI keeps drawing "QUITTING..." meanwhile
+                await asyncio.to_thread(_write_csv, filename, self.recorded_data)
             except Exception:
                 pass
         
@@ -618,9 +718,9 @@ class MonitorScreen(Screen):
         """Clear all data after confirmation."""
         def handle_clear_confirmation(confirmed: bool) -> None:
             if confirmed:
-                self.query_one("#chart", CO2PlotWidget).clear_data()
-                self.query_one("#stats", StatsWidget).clear_history()
-                self.query_one("#log", LogWidget).clear()
+                self._chart_widget.clear_data()
+                self._stats_widget.clear_history()
+                self._log_widget.clear()
                 self.recorded_data.clear()
                 self.flux_calc.clear()
                 self._plot_base_times.clear()
@@ -628,11 +728,10 @@ class MonitorScreen(Screen):
                 self._sample_peak_ppm = None
                 if self.static_sampling_mode:
                     self._reset_sample_cycle()
-                if hasattr(self, '_last_dt_per_plot'):
-                    self._last_dt_per_plot.clear()
+                self._last_dt_per_plot.clear()
                 # Update legend to reflect cleared plots
-                legend = self.query_one("#legend", ChannelLegend)
-                chart = self.query_one("#chart", CO2PlotWidget)
+                legend = self._legend_widget
+                chart = self._chart_widget
                 legend.set_plot_info(chart.filter_plot, chart.get_known_plots())
                 self.app.notify("Data cleared", severity="information")
         
@@ -648,7 +747,7 @@ class MonitorScreen(Screen):
     def action_pause(self) -> None:
         """Toggle pause state."""
         self.is_paused = not self.is_paused
-        stats = self.query_one("#stats", StatsWidget)
+        stats = self._stats_widget
         stats.is_paused = self.is_paused
         
         if self.is_paused:
@@ -667,7 +766,7 @@ class MonitorScreen(Screen):
 
     def action_big_mode(self) -> None:
         """Toggle high-visibility field mode."""
-        stats = self.query_one("#stats", StatsWidget)
+        stats = self._stats_widget
         big_screen = BigModeScreen()
         big_screen.current_co2 = stats.current_co2
         big_screen.record_count = stats.record_count
@@ -684,8 +783,8 @@ class MonitorScreen(Screen):
         sample_ppm: float | str = "",
         sample_peak_ppm: float | str = "",
     ) -> None:
-        chart = self.query_one("#chart", CO2PlotWidget)
-        stats = self.query_one("#stats", StatsWidget)
+        chart = self._chart_widget
+        stats = self._stats_widget
         plot = chart.current_plot
         dt_val = chart.current_dt
         current_ppm = stats.current_co2 if stats.current_co2 is not None else ""
@@ -728,14 +827,14 @@ class MonitorScreen(Screen):
                 if not note:
                     return
                 self._save_event_row("NOTE", note.strip())
-                self.query_one("#log", LogWidget).log_info(f"NOTE: {note}")
+                self._log_widget.log_info(f"NOTE: {note}")
                 self._write_raw_line("NOTE", note)
 
             self.app.push_screen(NoteInputScreen(), handle_note)
             return
 
-        log = self.query_one("#log", LogWidget)
-        stats = self.query_one("#stats", StatsWidget)
+        log = self._log_widget
+        stats = self._stats_widget
 
         if self._sample_flow_step == self.SAMPLE_STEP_IDLE:
             self._reset_sample_cycle()
@@ -799,9 +898,9 @@ class MonitorScreen(Screen):
 
     def action_toggle_static_mode(self) -> None:
         """Toggle static sampling mode."""
-        stats = self.query_one("#stats", StatsWidget)
+        stats = self._stats_widget
         self.static_sampling_mode = not self.static_sampling_mode
-        log = self.query_one("#log", LogWidget)
+        log = self._log_widget
         if self.static_sampling_mode:
             stats.static_sampling_mode = True
             self._reset_sample_cycle()
@@ -818,23 +917,48 @@ class MonitorScreen(Screen):
         """Reset the static sampling step sequence."""
         if not self.static_sampling_mode:
             return
-        self.query_one("#log", LogWidget).log_info("STATIC: Cycle reset.")
+        self._log_widget.log_info("STATIC: Cycle reset.")
         self._reset_sample_cycle()
 
-    @work(thread=True)
-    def save_reading_worker(self, session_id: int, data: dict) -> None:
-        """Background worker to save data to DB without blocking UI."""
+    def _flush_db_buffer(self) -> None:
+        """Write buffered readings as one batch off the event loop."""
+        if self._db_write is not None and not self._db_write.done():
+            # One batch at a time, so batches commit in order; the buffer
+            # keeps filling and goes out on a later tick
+            return
+        if not self._db_buffer or not self.session_id:
+            return
+        readings, self._db_buffer = self._db_buffer, []
+        self._db_write = asyncio.ensure_future(
+            asyncio.to_thread(self._save_readings, self.session_id, readings)
+        )
+
+    def _save_readings(self, session_id: int, readings: list[dict]) -> None:
+        """Save a batch of readings to the DB (runs in a thread)."""
         try:
             if self.db:
-                self.db.insert_reading(session_id, data)
+                self.db.insert_readings(session_id, readings)
         except Exception:
             pass
 
+    async def _drain_db_buffer(self) -> None:
+        """Write any buffered readings before the screen goes away."""
+        # Go through the same one-batch-at-a-time path as the timer, and only
+        # return once nothing is being written and nothing is left buffered
+        while True:
+            write = self._db_write
+            if write is not None and not write.done():
+                await write
+                continue
+            if not (self._db_buffer and self.db and self.session_id):
+                return
+            self._flush_db_buffer()
+
     # Channel selection actions (Dynamic)
     def action_select_slot(self, slot_idx: str) -> None:
         """Select a channel by its slot index (1-9)."""
-        chart = self.query_one("#chart", CO2PlotWidget)
-        legend = self.query_one("#legend", ChannelLegend)
+        chart = self._chart_widget
+        legend = self._legend_widget
         
         # Chart finds the key for this slot based on current config (SRC/CPY/etc)
         active_key = chart.set_active_by_slot_index(slot_idx)
@@ -842,68 +966,45 @@ class MonitorScreen(Screen):
         if active_key:
             legend.set_active(active_key)
 
-    def action_select_atmp(self) -> None:
-        self._select_channel("atmp")
-
-    def action_select_dt(self) -> None:
-        self._select_channel("dt")
-
-    # Span control actions
-
-
     def action_help(self) -> None:
         """Show the help screen."""
         self.app.push_screen(HelpScreen())
 
     def action_next_plot(self) -> None:
         """Switch to next plot."""
-        chart = self.query_one("#chart", CO2PlotWidget)
-        legend = self.query_one("#legend", ChannelLegend)
+        chart = self._chart_widget
+        legend = self._legend_widget
         chart.next_plot()
         legend.set_plot_info(chart.filter_plot, chart.get_known_plots())
 
     def action_prev_plot(self) -> None:
         """Switch to previous plot."""
-        chart = self.query_one("#chart", CO2PlotWidget)
-        legend = self.query_one("#legend", ChannelLegend)
+        chart = self._chart_widget
+        legend = self._legend_widget
         chart.prev_plot()
         legend.set_plot_info(chart.filter_plot, chart.get_known_plots())
 
     def action_toggle_cursor(self) -> None:
         """Toggle data cursor mode."""
-        chart = self.query_one("#chart", CO2PlotWidget)
+        chart = self._chart_widget
         chart.toggle_cursor()
 
     def action_cursor_left(self) -> None:
         """Move cursor left."""
-        chart = self.query_one("#chart", CO2PlotWidget)
+        chart = self._chart_widget
         chart.cursor_left()
 
     def action_cursor_right(self) -> None:
         """Move cursor right."""
-        chart = self.query_one("#chart", CO2PlotWidget)
+        chart = self._chart_widget
         chart.cursor_right()
 
     def action_cursor_home(self) -> None:
         """Move cursor to start."""
-        chart = self.query_one("#chart", CO2PlotWidget)
+        chart = self._chart_widget
         chart.cursor_home()
 
     def action_cursor_end(self) -> None:
         """Move cursor to end."""
-        chart = self.query_one("#chart", CO2PlotWidget)
+        chart = self._chart_widget
         chart.cursor_end()
-
-
-# Custom message types
-@dataclass
-class DataReceived(Message):
-    """Message for received serial data."""
-    raw_line: str
-    parsed: dict
-
-
-@dataclass
-class SerialError(Message):
-    """Message for serial errors."""
-    message: str
@@ -1,5 +1,6 @@
+from calendar import monthrange
 from datetime import date, timedelta
-from typing import Set
+from typing import Set, Tuple
 
 from rich.text import Text
 from textual.app import ComposeResult
@@ -10,6 +11,12 @@ from textual.widget import Widget
 from textual.widgets import Button, Static
 
 
+def _months_around(month: date) -> Tuple[date, date, date, date]:
+    """First days of the previous, given, next and following months."""
+    index = month.year * 12 + month.month - 1
+    return tuple(date(i // 12, i % 12 + 1, 1) for i in range(index - 1, index + 3))
+
+
 class CalendarDay(Static):
     """A single day cell in the calendar grid."""
 
@@ -174,6 +181,11 @@ class CalendarWidget(Widget):
         super().__init__(id=id)
         self.data_dates: Set[date] = set()
         self.selected_dates: Set[date] = set()
+        self._calendar_refresh_pending = False
+        # Mounted day cells by date, so cursor/selection changes touch one cell
+        self._cells: dict[date, CalendarDay] = {}
+        # Visible month starts plus the one after the view; see watch_current_month
+        self._view_months = _months_around(self.current_month)
 
     def set_data_dates(self, dates: Set[date]) -> None:
         self.data_dates = dates
@@ -181,7 +193,7 @@ class CalendarWidget(Widget):
             latest = max(dates)
             self.current_month = latest.replace(day=1)
             self.cursor_date = latest
-        self.refresh_calendar()
+        self._schedule_calendar_refresh()
 
     def get_selected_dates(self) -> Set[date]:
         return self.selected_dates
@@ -219,34 +231,46 @@ class CalendarWidget(Widget):
                         yield Static(day, classes="day-header")
                 yield Grid(id="grid-2", classes="calendar-grid")
 
-    def on_mount(self) -> None:
-        self.refresh_calendar()
+    async def on_mount(self) -> None:
+        await self.refresh_calendar()
+
+    def _schedule_calendar_refresh(self) -> None:
+        """Coalesce rebuild requests from the same tick into one refresh_calendar."""
+        if self._calendar_refresh_pending:
+            return
+        self._calendar_refresh_pending = True
+        self.call_after_refresh(self._do_calendar_refresh)
 
-    def refresh_calendar(self) -> None:
+    async def _do_calendar_refresh(self) -> None:
+        self._calendar_refresh_pending = False
+        await self.refresh_calendar()
+
+    async def refresh_calendar(self) -> None:
         # Offsets: -1, 0, +1
-        start_months = [
-            (self.current_month - timedelta(days=1)).replace(day=1),
-            self.current_month,
-            (self.current_month.replace(day=28) + timedelta(days=4)).replace(day=1)
-        ]
+        start_months = self._view_months[:3]
+        self._cells = {}
+        data_dates = self.data_dates
+        selected_dates = self.selected_dates
         
         for i, month_start in enumerate(start_months):
             label = self.query_one(f"#label-{i}", Static)
             label.update(month_start.strftime("%B %Y"))
             
             grid = self.query_one(f"#grid-{i}", Grid)
-            grid.remove_children()
+            # Wait for the old cells to go so their ids can be reused
+            await grid.remove_children()
             
             # Days
-            start_weekday = (month_start.weekday() + 1) % 7
+            first_weekday, days_in_month = monthrange(month_start.year, month_start.month)
+            start_weekday = (first_weekday + 1) % 7
             for _ in range(start_weekday):
                 # Empty spacer
                 grid.mount(CalendarDay(None))
                 
-            current = month_start
-            while current.month == month_start.month:
-                has_data = current in self.data_dates
-                is_selected = current in self.selected_dates
+            for day in range(1, days_in_month + 1):
+                current = month_start.replace(day=day)
+                has_data = current in data_dates
+                is_selected = current in selected_dates
                 
                 # Assign ID for fast lookup: day-YYYY-MM-DD
                 day_id = f"day-{current.isoformat()}"
@@ -256,28 +280,22 @@ class CalendarWidget(Widget):
                 if current == self.cursor_date:
                     day_widget.add_class("cursor")
                 
+                self._cells[current] = day_widget
                 grid.mount(day_widget)
-                current += timedelta(days=1)
 
-    def watch_cursor_date(self, new_date: date, old_date: date | None) -> None:
-        # 1. Try to find the old cursor and remove class
-        if old_date:
-            try:
-                old_widget = self.query_one(f"#day-{old_date.isoformat()}", CalendarDay)
-                old_widget.remove_class("cursor")
-            except:
-                pass # Probably not visible
+    def watch_cursor_date(self, old_date: date, new_date: date) -> None:
+        # 1. Remove the class from the old cursor (if it's visible)
+        old_widget = self._cells.get(old_date)
+        if old_widget is not None:
+            old_widget.remove_class("cursor")
 
         # 2. Check if new cursor is waiting to be shown?
         # Check if we need to shift view first
-        start_curr = self.current_month
-        next_month = (start_curr.replace(day=28) + timedelta(days=4)).replace(day=1) 
-        prev_month = (start_curr - timedelta(days=1)).replace(day=1)
-        month_after_next = (next_month.replace(day=28) + timedelta(days=4)).replace(day=1)
+        prev_month, _, next_month, month_after_next = self._view_months
         
         should_shift = False
         if new_date < prev_month:
-             self.current_month = (self.current_month - timedelta(days=1)).replace(day=1)
+             self.current_month = prev_month
              should_shift = True
         elif new_date >= month_after_next:
              self.current_month = next_month
@@ -285,18 +303,19 @@ class CalendarWidget(Widget):
              
         if should_shift:
             # Refresh will rebuild and apply cursor correctly
-            self.refresh_calendar()
+            self._schedule_calendar_refresh()
         else:
-            # 3. Try to find new cursor and add class
-            try:
-                new_widget = self.query_one(f"#day-{new_date.isoformat()}", CalendarDay)
+            # 3. Add the class to the new cursor
+            new_widget = self._cells.get(new_date)
+            if new_widget is not None:
                 new_widget.add_class("cursor")
-            except:
+            else:
                 # Should be rare if logic above is correct, but safer to refresh
-                self.refresh_calendar()
+                self._schedule_calendar_refresh()
 
     def watch_current_month(self, new_month: date) -> None:
-        self.refresh_calendar()
+        self._view_months = _months_around(new_month)
+        self._schedule_calendar_refresh()
 
     def action_move_left(self) -> None:
         self.cursor_date -= timedelta(days=1)
@@ -315,7 +334,11 @@ class CalendarWidget(Widget):
             self.selected_dates.remove(self.cursor_date)
         else:
             self.selected_dates.add(self.cursor_date)
-        self.refresh_calendar()
+        cell = self._cells.get(self.cursor_date)
+        if cell is not None:
+            cell.set_class(self.cursor_date in self.selected_dates, "selected")
+        else:
+            self._schedule_calendar_refresh()
         self.post_message(self.SelectionChanged(self.selected_dates))
         
     def action_confirm_selection(self) -> None:
@@ -324,12 +347,9 @@ class CalendarWidget(Widget):
     def on_button_pressed(self, event: Button.Pressed) -> None:
         if event.button.id == "prev-month":
              # Shift view back by 1 month
-            first = self.current_month.replace(day=1)
-            prev = first - timedelta(days=1)
-            self.current_month = prev.replace(day=1)
+            self.current_month = self._view_months[0]
         elif event.button.id == "next-month":
-            next_month = (self.current_month.replace(day=28) + timedelta(days=4)).replace(day=1)
-            self.current_month = next_month
+            self.current_month = self._view_months[2]
             
     def on_calendar_day_selected(self, message: CalendarDay.Selected) -> None:
         """Handle click selection."""
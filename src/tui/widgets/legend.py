@@ -90,6 +90,7 @@ class ChannelLegend(Widget):
         super().__init__(name=name, id=id, classes=classes, disabled=disabled)
         self._active: str = 'cr'
         self._probe_type = probe_type
+        self._plot_info: tuple[int | None, list[int]] | None = None
         # Default init
         self.set_probe_type(probe_type)
 
@@ -134,6 +135,11 @@ class ChannelLegend(Widget):
 
     def set_plot_info(self, current_plot: int | None, known_plots: list[int]) -> None:
         """Update plot filter display info."""
+        # Called for every batch of samples; skip the repaint if nothing changed
+        plot_info = (current_plot, known_plots)
+        if plot_info == self._plot_info:
+            return
+        self._plot_info = plot_info
         self._current_plot = current_plot
         self._known_plots = known_plots
         self.refresh()
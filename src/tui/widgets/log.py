@@ -1,7 +1,7 @@
 """Log Widget - Scrollable event log for raw data stream."""
 
 import sys
-from datetime import datetime
+import time
 from textual.widgets import RichLog
 
 # Symbol definitions
@@ -56,7 +56,7 @@ class LogWidget(RichLog):
             message: The message to log.
             style: Optional Rich style for the message.
         """
-        timestamp = datetime.now().strftime("%H:%M:%S")
+        timestamp = time.strftime("%H:%M:%S")
         if style:
             formatted = f"[dim]{timestamp}[/dim] [{style}]{message}[/{style}]"
         else:
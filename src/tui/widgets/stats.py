@@ -1,5 +1,6 @@
 """Stats Widget - Displays key metrics and connection status."""
 
+import math
 import statistics
 from collections import deque
 
@@ -10,6 +11,9 @@ from rich.text import Text
 from textual.widget import Widget
 from textual.reactive import reactive
 
+# Number of recent readings used for the stability indicator
+STABILITY_WINDOW = 10
+
 
 class StatsWidget(Widget):
     """Widget displaying CO2 statistics and connection status."""
@@ -51,17 +55,46 @@ class StatsWidget(Widget):
     ) -> None:
         super().__init__(name=name, id=id, classes=classes, disabled=disabled)
         self._history: deque[float] = deque(maxlen=100)
+        # Last STABILITY_WINDOW readings with running sums, so the stability
+        # stdev is O(1) per reading
+        self._recent: deque[float] = deque(maxlen=STABILITY_WINDOW)
+        self._recent_sum = 0.0
+        self._recent_sumsq = 0.0
 
     def add_reading(self, co2: float, record: int | None = None) -> None:
         """Add a new CO2 reading to history and update current value."""
         self._history.append(co2)
+        recent = self._recent
+        if len(recent) == STABILITY_WINDOW:
+            oldest = recent[0]
+            self._recent_sum -= oldest
+            self._recent_sumsq -= oldest * oldest
+        recent.append(co2)
+        self._recent_sum += co2
+        self._recent_sumsq += co2 * co2
         self.current_co2 = co2
         if record is not None:
             self.hw_record = record
 
+    def add_readings(self, values: list[float], record: int | None = None) -> None:
+        """Add several CO2 readings, updating the display once for the last one."""
+        if not values:
+            return
+        self._history.extend(values)
+        recent = self._recent
+        recent.extend(values)
+        self._recent_sum = sum(recent)
+        self._recent_sumsq = sum(v * v for v in recent)
+        self.current_co2 = values[-1]
+        if record is not None:
+            self.hw_record = record
+
     def clear_history(self) -> None:
         """Clear the history data."""
         self._history.clear()
+        self._recent.clear()
+        self._recent_sum = 0.0
+        self._recent_sumsq = 0.0
         self.current_co2 = None
         self.parsed_records = 0
         self.parse_errors = 0
@@ -69,6 +102,15 @@ class StatsWidget(Widget):
         self.serial_errors = 0
         self.static_sampling_step = ""
 
+    def recent_stdev(self) -> float | None:
+        """Sample standard deviation of the last STABILITY_WINDOW readings."""
+        n = len(self._recent)
+        if n < 2:
+            return None
+        var = (self._recent_sumsq - self._recent_sum * self._recent_sum / n) / (n - 1)
+        # Clamp tiny negative values from floating-point cancellation
+        return math.sqrt(max(var, 0.0))
+
     def _calculate_stats(self) -> dict:
         """Calculate statistics from history."""
         if len(self._history) < 2:
@@ -80,17 +122,15 @@ class StatsWidget(Widget):
         max_val = max(data)
         
         # Calculate stability from recent readings
-        recent = data[-10:] if len(data) >= 10 else data
-        try:
-            stdev = statistics.stdev(recent)
-            if stdev < 5:
-                stability = "STABLE"
-            elif stdev < 20:
-                stability = "VARIABLE"
-            else:
-                stability = "NOISY"
-        except statistics.StatisticsError:
+        stdev = self.recent_stdev()
+        if stdev is None:
             stability = "---"
+        elif stdev < 5:
+            stability = "STABLE"
+        elif stdev < 20:
+            stability = "VARIABLE"
+        else:
+            stability = "NOISY"
         
         return {"avg": avg, "min": min_val, "max": max_val, "stability": stability}
 
@@ -0,0 +1,29 @@
+import asyncio
+
+from textual.app import App
+from textual.widgets import Static
+
+from src.tui.screens.bigmode import BigModeScreen
+
+
+def test_big_mode_renders_initial_values_on_open() -> None:
+    async def run() -> tuple[str, str, str]:
+        app = App()
+        async with app.run_test() as pilot:
+            screen = BigModeScreen()
+            screen.current_co2 = 412.0
+            screen.record_count = 7
+            await app.push_screen(screen)
+            await pilot.pause()
+            value = str(screen.query_one("#big-co2-value", Static).render())
+            records = str(screen.query_one("#big-record-count", Static).render())
+            return value, records, screen._render_big_number(412)
+
+    # A private loop, so later tests still get the thread's default loop
+    loop = asyncio.new_event_loop()
+    try:
+        value, records, digits = loop.run_until_complete(run())
+    finally:
+        loop.close()
+    assert value == digits
+    assert records == "Records: 7"
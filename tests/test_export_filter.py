@@ -0,0 +1,66 @@
+from datetime import date, datetime
+from itertools import chain, combinations
+
+import pytest
+
+from src.tui.screens.export import ExportScreen
+
+DAYS = [date(2025, 3, 5), date(2025, 3, 6), date(2025, 3, 7)]
+
+
+def _rows() -> list[dict]:
+    rows = [
+        {'timestamp': f"{DAYS[i % 3].isoformat()}T10:{i % 60:02d}:00", 'plot': i % 4, 'co2_ppm': 400 + i}
+        for i in range(40)
+    ]
+    # Rows the date filter can't place on a day
+    rows.insert(5, {'timestamp': "not-a-date", 'plot': 1, 'co2_ppm': 1})
+    rows.insert(12, {'plot': 2, 'co2_ppm': 2})
+    rows.insert(20, {'timestamp': None, 'plot': 3, 'co2_ppm': 3})
+    return rows
+
+
+def _naive_filter(rows: list[dict], plots: set, dates: set) -> list[dict]:
+    """The original per-row check: a date filter drops unparseable strings only."""
+    kept = []
+    for row in rows:
+        if row.get('plot') not in plots:
+            continue
+        ts = row.get('timestamp')
+        if dates and isinstance(ts, str):
+            try:
+                if datetime.fromisoformat(ts).date() not in dates:
+                    continue
+            except ValueError:
+                continue
+        kept.append(row)
+    return kept
+
+
+def _subsets(items: list) -> list[set]:
+    return [set(c) for c in chain.from_iterable(combinations(items, n) for n in range(len(items) + 1))]
+
+
+@pytest.mark.parametrize("dates", _subsets(DAYS + [date(2024, 1, 1)]))
+@pytest.mark.parametrize("plots", [{0, 1, 2, 3}, {1}, {0, 3}, set(), {9}])
+def test_filtered_rows_match_naive_filter(plots: set, dates: set) -> None:
+    rows = _rows()
+    screen = ExportScreen(rows)
+    screen.selected_plots = plots
+    screen.selected_dates = dates
+
+    expected = _naive_filter(rows, plots, dates)
+    assert list(screen._iter_filtered_rows()) == expected
+    assert screen._count_filtered_rows() == len(expected)
+
+
+def test_rows_appended_after_opening_are_indexed() -> None:
+    rows = _rows()
+    screen = ExportScreen(rows)
+    screen.selected_dates = {DAYS[1]}
+    rows.append({'timestamp': f"{DAYS[1].isoformat()}T23:00:00", 'plot': 0, 'co2_ppm': 999})
+    rows.append({'plot': 0, 'co2_ppm': 998})
+
+    expected = _naive_filter(rows, screen.selected_plots, {DAYS[1]})
+    assert list(screen._iter_filtered_rows()) == expected
+    assert screen._count_filtered_rows() == len(expected)
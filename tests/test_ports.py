@@ -0,0 +1,30 @@
+from types import SimpleNamespace
+
+from src.tui.screens.connect import find_best_port
+
+
+def _port(device: str, description: str = "n/a") -> SimpleNamespace:
+    return SimpleNamespace(device=device, description=description)
+
+
+def test_find_best_port_prefers_usb_serial_device() -> None:
+    ports = [_port("/dev/ttyS0"), _port("/dev/ttyUSB0"), _port("/dev/cu.Bluetooth")]
+
+    assert find_best_port(ports) == "/dev/ttyUSB0"
+
+
+def test_find_best_port_matches_adapter_chip_description() -> None:
+    ports = [_port("COM12", "Bluetooth Link"), _port("COM14", "Prolific PL2303")]
+
+    assert find_best_port(ports) == "COM14"
+
+
+def test_find_best_port_falls_back_to_low_com_port() -> None:
+    ports = [_port("COM12", "Bluetooth Link"), _port("COM3", "Communications Port")]
+
+    assert find_best_port(ports) == "COM3"
+
+
+def test_find_best_port_ignores_non_usb_ports() -> None:
+    assert find_best_port([_port("/dev/ttyS0"), _port("/dev/cu.Bluetooth")]) is None
+    assert find_best_port([]) is None
@@ -0,0 +1,39 @@
+import statistics
+
+import pytest
+
+from src.tui.widgets.stats import STABILITY_WINDOW, StatsWidget
+
+
+def test_recent_stdev_matches_statistics_over_window() -> None:
+    stats = StatsWidget()
+    readings = [400.0, 402.5, 398.0, 410.0, 405.5, 399.0, 401.0, 420.0, 395.0, 400.5, 430.0, 388.0]
+    for value in readings:
+        stats.add_reading(value)
+
+    expected = statistics.stdev(readings[-STABILITY_WINDOW:])
+    assert stats.recent_stdev() == pytest.approx(expected)
+
+
+def test_recent_stdev_needs_two_readings_and_resets_on_clear() -> None:
+    stats = StatsWidget()
+    stats.add_reading(400.0)
+    assert stats.recent_stdev() is None
+
+    stats.add_reading(410.0)
+    stats.clear_history()
+    assert stats.recent_stdev() is None
+
+
+def test_add_readings_matches_individual_adds() -> None:
+    readings = [400.0, 402.5, 398.0, 410.0, 405.5, 399.0, 401.0, 420.0, 395.0, 400.5, 430.0, 388.0]
+    single = StatsWidget()
+    for value in readings:
+        single.add_reading(value, record=7)
+    bulk = StatsWidget()
+    bulk.add_readings(readings, record=7)
+
+    assert list(bulk._history) == list(single._history)
+    assert bulk.current_co2 == single.current_co2
+    assert bulk.hw_record == 7
+    assert bulk.recent_stdev() == pytest.approx(single.recent_stdev())